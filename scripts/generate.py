@@ -9,6 +9,7 @@ import random
 import string
 import atexit
 import torch
+from scripts.segments import split_into_segments
 
 # Global to track temporary files
 temp_files = set()
@@ -25,6 +26,40 @@ def cleanup_temp_files():
 # Register cleanup function
 atexit.register(cleanup_temp_files)
 
+SAMPLE_RATE = 22050
+HOP_LENGTH = 256  # HIFIGAN samples per mel frame
+SYNTHESIS_BATCH_SIZE = 8
+SEGMENT_PAUSE_SECONDS = 0.25
+
+def synthesize_segments(tacotron2, hifi_gan, segments):
+    """
+    Synthesize segments in bounded Tacotron2/HIFIGAN batches.
+    
+    Args:
+        tacotron2: Loaded Tacotron2 model
+        hifi_gan: Loaded HIFIGAN vocoder
+        segments: Dictionary of key to segment text
+        
+    Returns:
+        dict: Key to mono waveform tensor (1, samples) on the CPU
+    """
+    # Tacotron2 requires batch inputs sorted by decreasing encoded length,
+    # sorting all segments first also keeps padding within each batch small
+    keys = sorted(segments, key=lambda k: tacotron2.text_to_seq(segments[k])[1], reverse=True)
+
+    segment_audio = {}
+    for start in range(0, len(keys), SYNTHESIS_BATCH_SIZE):
+        batch_keys = keys[start:start + SYNTHESIS_BATCH_SIZE]
+        with torch.no_grad():
+            mel_outputs, mel_lengths, alignments = tacotron2.encode_batch([segments[k] for k in batch_keys])
+            waveforms = hifi_gan.decode_batch(mel_outputs).squeeze(1).cpu()
+
+        for key, waveform, mel_length in zip(batch_keys, waveforms, mel_lengths.tolist()):
+            # Trim the padding introduced by batching, clone so the padded batch can be freed
+            segment_audio[key] = waveform[:mel_length * HOP_LENGTH].clone().unsqueeze(0)
+        del mel_outputs, mel_lengths, alignments, waveforms
+    return segment_audio
+
 def generate_tts_audio(text, model_name, model_dir, cached_text, settings=None):
     """
     Generate TTS audio from text using SpeechBrain's Tacotron2 and HIFIGAN.
@@ -69,14 +104,23 @@ def generate_tts_audio(text, model_name, model_dir, cached_text, settings=None):
             run_opts={"device": device}
         )
 
-        # Running the TTS
-        mel_output, mel_length, alignment = tacotron2.encode_text(text)
-
-        # Running Vocoder (spectrogram-to-waveform)
-        waveforms = hifi_gan.decode_batch(mel_output)
+        unique, order = split_into_segments(text)
+        if not order:
+            raise ValueError("No speakable text found")
+        if len(order) > len(unique):
+            print(f"Reused audio for {len(order) - len(unique)} duplicate segment(s)")
+
+        # Synthesize each unique segment once, repeats reference the same tensor
+        segment_audio = synthesize_segments(tacotron2, hifi_gan, unique)
+        silence = torch.zeros(1, int(SAMPLE_RATE * SEGMENT_PAUSE_SECONDS))
+        pieces = []
+        for key in order:
+            if pieces:
+                pieces.append(silence)
+            pieces.append(segment_audio[key])
 
         # Save the waveform
-        torchaudio.save(output_path, waveforms.squeeze(1).cpu(), 22050)
+        torchaudio.save(output_path, torch.cat(pieces, dim=-1), SAMPLE_RATE)
 
         if not os.path.exists(output_path):
             raise FileNotFoundError("TTS engine failed to create audio file")
@@ -0,0 +1,61 @@
+# ./scripts/segments.py
+
+import re
+
+# A line ends a sentence when it finishes with . ! or ?, optionally followed by closing quotes or brackets
+SENTENCE_END = re.compile(r"[.!?][\"')\]]*$")
+
+def normalize_segment(segment):
+    """Normalize a segment so repeated lines compare equal regardless of spacing or case"""
+    return " ".join(segment.split()).casefold()
+
+def iter_segments(text):
+    """
+    Yield the spoken segments of a text in document order.
+
+    Each non-empty line is a segment, except that a line which does not end a
+    sentence is joined with the next line when that line starts lowercase, so a
+    sentence wrapped across lines stays one utterance. Headings, refrains and
+    other short lines stay on their own and can be matched as repeats.
+
+    Args:
+        text: Input text to split
+
+    Yields:
+        str: Segment text with whitespace collapsed
+    """
+    current = []
+    for line in text.splitlines():
+        line = " ".join(line.split())
+        if not line:
+            if current:
+                yield " ".join(current)
+                current = []
+            continue
+        if current and (SENTENCE_END.search(current[-1]) or not line[0].islower()):
+            yield " ".join(current)
+            current = []
+        current.append(line)
+    if current:
+        yield " ".join(current)
+
+def split_into_segments(text):
+    """
+    Split text into segments, grouping identical ones.
+
+    Args:
+        text: Input text to split
+
+    Returns:
+        tuple: (unique, order) where unique maps each normalized key to the
+        first segment seen for it, and order lists the keys in document
+        order (keys repeat for duplicate segments)
+    """
+    unique = {}
+    order = []
+    for segment in iter_segments(text):
+        key = normalize_segment(segment)
+        if key not in unique:
+            unique[key] = segment
+        order.append(key)
+    return unique, order
@@ -0,0 +1,37 @@
+# ./tests/test_segments.py
+
+from scripts.segments import split_into_segments
+
+def test_repeated_lines_are_grouped():
+    unique, order = split_into_segments("Refrain\nVerse one\nRefrain\nVerse two\nRefrain")
+    assert list(unique.values()) == ["Refrain", "Verse one", "Verse two"]
+    assert order == ["refrain", "verse one", "refrain", "verse two", "refrain"]
+
+def test_repeated_heading_across_paragraphs():
+    unique, order = split_into_segments("Chapter 1\nThe cat sat.\n\nChapter 1\nThe dog ran.")
+    assert order == ["chapter 1", "the cat sat.", "chapter 1", "the dog ran."]
+    assert len(unique) == 3
+
+def test_repeated_paragraphs_are_grouped():
+    paragraph = "This is a disclaimer that wraps\nover two lines."
+    unique, order = split_into_segments(f"{paragraph}\n\nBody text.\n\n{paragraph}")
+    assert len(order) == 3
+    assert order[0] == order[2]
+    assert unique[order[0]] == "This is a disclaimer that wraps over two lines."
+
+def test_wrapped_sentence_stays_one_segment():
+    unique, order = split_into_segments("The quick brown fox jumped over\nthe lazy dog and then ran\naway.")
+    assert list(unique.values()) == ["The quick brown fox jumped over the lazy dog and then ran away."]
+
+def test_crlf_input():
+    unique, order = split_into_segments("Refrain\r\nVerse one\r\n\r\nRefrain\r\n")
+    assert order == ["refrain", "verse one", "refrain"]
+
+def test_case_and_whitespace_variants_match():
+    unique, order = split_into_segments("Read the  Notice.\n  read THE notice.  \n\tRead the notice.")
+    assert len(unique) == 1
+    assert len(order) == 3
+    assert unique[order[0]] == "Read the Notice."
+
+def test_blank_text_has_no_segments():
+    assert split_into_segments(" \n\n\t\n") == ({}, [])